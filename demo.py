@@ -1,3 +1,5 @@
+import numpy as np
+
 from src.core import FZVerifier
 
 """
@@ -36,9 +38,10 @@ try:
 except ImportError:
     print("Matplotlib is not installed; skipping graph demonstration.")
 else:
-    # Compute P for a range of tp values (here p=1.0 so tp = t)
-    xs = [0.0] + [x * 0.1 for x in range(1, 101)]
-    ys = [0.0] + [verifier.manifestation_probability(1.0, x) for x in xs[1:]]
+    # P(tp) = -expm1(-tp) over the whole tp grid in one NumPy expression
+    # (the grid includes tp = 0, which the verifier rejects as t <= 0)
+    xs = np.linspace(0.0, 10.0, 101)
+    ys = -np.expm1(-xs)
 
     plt.figure()
     plt.plot(xs, ys, label="$P(tp) = 1 - e^{-tp}$")
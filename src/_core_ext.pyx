@@ -0,0 +1,83 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled (Cython) kernels for the manifestation probability
+
+    P(t,p) = -expm1(-tp).
+
+Build in place with
+
+    cythonize -i src/_core_ext.pyx
+
+When the extension is not built, src.core keeps its pure-Python
+manifestation_probability and src._fast falls back to Numba or NumPy
+for batch evaluation.
+"""
+from libc.math cimport expm1
+
+
+cdef inline double _prob(double p, double t) noexcept nogil:
+    cdef double tp = t * p
+
+    # Same regimes as the pure-Python version in src/core.py
+    if tp >= 38.0:
+        return 1.0
+    if tp < 1e-16:
+        return tp
+    return -expm1(-tp)
+
+
+def manifestation_probability(double p, double t):
+    """
+    Probability of distinction manifestation in the pre-existential
+    null domain (PND) in the continuous model.
+
+        P(t,p) = 1 - exp(-tp),
+
+    implemented in a numerically stable form via:
+
+        P = -expm1(-tp)   (since -expm1(-tp) = 1 - exp(-tp)).
+
+    Compiled drop-in for the pure-Python version in src/core.py.
+
+    Parameters
+    ----------
+    p : float
+        Probability of a single elementary manifestation
+        (0 < p ≤ 1). Conceptually, this is the success probability
+        of one "attempt" in the PND.
+    t : float
+        Measure of the capacity of possible distinctions (t > 0).
+        In the theory, this plays the role of a non-metric attempt
+        index rather than physical time.
+
+    Returns
+    -------
+    float
+        Manifestation probability (0 ≤ P ≤ 1).
+
+    Raises
+    ------
+    ValueError
+        If p <= 0 or t <= 0 (invalid parameters).
+    """
+    if p <= 0 or t <= 0:
+        raise ValueError("p and t must be positive")
+
+    return _prob(p, t)
+
+
+def batch_probability(
+    const double[::1] p,
+    const double[::1] t,
+    double[::1] out
+):
+    """
+    Fill out[i] = P(t[i], p[i]) for contiguous 1-D float64 arrays p, t
+    and out of equal length (same contract as the Numba kernel in
+    src/_fast.py; inputs are validated by the caller).
+    """
+    cdef Py_ssize_t i, n = p.shape[0]
+
+    with nogil:
+        for i in range(n):
+            out[i] = _prob(p[i], t[i])
@@ -0,0 +1,60 @@
+"""
+Optional compiled kernels for batch evaluation of the FZ Theory
+formulas.
+
+Numba is not a hard dependency: when it is not installed the Cython
+kernel from src/_core_ext.pyx is used if it has been built, and
+otherwise the kernels below are set to None and the plain NumPy
+implementations in src.core are used.
+"""
+import math
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+# True when Numba links Intel SVML and can emit vectorized expm1 calls
+USING_SVML = HAVE_NUMBA and bool(numba.config.USING_SVML)
+
+
+# fastmath=True minus the no-NaN/no-Inf assumptions ('nnan', 'ninf'),
+# under which the clamps below would map a NaN input to 1.0 instead of
+# propagating it like the NumPy and Cython paths
+_FASTMATH = {"contract", "afn", "reassoc", "arcp", "nsz"}
+
+
+if HAVE_NUMBA:
+    @numba.njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def batch_probability(p, t, out):
+        """
+        Fill out[i] = -expm1(-t[i] * p[i]), clamped to [0, 1], for
+        contiguous 1-D float64 arrays p, t and out of equal length.
+        """
+        for i in numba.prange(p.shape[0]):
+            v = -math.expm1(-t[i] * p[i])
+            out[i] = 0.0 if v < 0.0 else (1.0 if v > 1.0 else v)
+
+    @numba.njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def batch_asymmetry(phi, out):
+        """
+        Fill out[i] = (Φ² - 1) / (Φ² + 1) for contiguous 1-D float64
+        arrays phi and out of equal length, in one fused pass.
+        """
+        for i in numba.prange(phi.shape[0]):
+            x = phi[i]
+            # Same saturation as src.core.asymmetry: keeps Φ² finite
+            if x > 1e150:
+                out[i] = 1.0
+            else:
+                x2 = x * x
+                out[i] = (x2 - 1.0) / (x2 + 1.0)
+else:
+    try:
+        from ._core_ext import batch_probability
+    except ImportError:
+        batch_probability = None
+
+    batch_asymmetry = None
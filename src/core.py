@@ -1,295 +1,763 @@
+from __future__ import annotations
+
 import numpy as np
 import math
-from decimal import Decimal, getcontext
-from typing import Union
+from decimal import Context, Decimal, Inexact, localcontext
+from functools import cache, lru_cache
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+__all__ = [
+    "FZVerifier",
+    "get_verifier",
+    "manifestation_probability",
+    "manifestation_probability_array",
+    "manifestation_probability_batch",
+    "manifestation_probability_decimal",
+    "manifestation_probability_mpfr",
+    "critical_point_for_probability",
+    "nothing_weight",
+    "asymmetry",
+    "asymmetry_array",
+    "structure_density",
+    "structure_density_array",
+]
 
 # Default precision for Decimal calculations
 DEFAULT_PRECISION = 100
-getcontext().prec = DEFAULT_PRECISION
 
+# Above this tp, P(t,p) = 1 - exp(-tp) equals 1.0 in double precision
+_TP_SATURATION = 38.0
 
-class FZVerifier:
-    """
-    FZ Theory verification toolkit with numerically stable implementations.
+# Below this tp, P(t,p) = 1 - exp(-tp) equals tp in double precision
+_TP_LINEAR = 1e-16
 
-    This class implements the core mathematical components used in the
-    article on FZ Theory: the manifestation probability in a
-    pre-existential null domain (PND), critical tp thresholds, high-
-    precision discrete analogues of the infinite-attempt process, a
-    phenomenological "weight" model for the PND, the asymmetry function
-    A(Φ) describing symmetry breaking between non-being and being, and
-    a simple densification model ρ(t).
+# Closed forms of E(Φ) = Φ · ρ(Φ) for the Φ-dependent PND scenarios
+# (see nothing_weight; 'balanced' is the constant 1); sqrt avoids the
+# generic pow() call.
+_WEIGHT = {
+    "growth": math.sqrt,                          # Φ^(0.5)
+    "decay": lambda phi: 1.0 / math.sqrt(phi),    # Φ^(-0.5)
+}
 
-    FIXED:
-    - Removed legacy unstable branches.
-    - All formulas now use a single, mathematically consistent and
-      numerically robust implementation that matches the published
-      definitions.
-    """
+# Above this potential the asymmetry A(Φ) equals 1.0 in double precision
+_PHI_SATURATION = 1e150
 
-    @staticmethod
-    def manifestation_probability(p: float, t: float) -> float:
-        """
-        Probability of distinction manifestation in the pre-existential
-        null domain (PND) in the continuous model.
+# Shared Decimal constant (immutable, exact at any precision)
+_DEC_ONE = Decimal(1)
 
-            P(t,p) = 1 - exp(-tp),
+# Extra Decimal digits carried through manifestation_probability_decimal
+_DECIMAL_GUARD_DIGITS = 10
 
-        implemented in a numerically stable form via:
+# Below this |x|, ln(1 + x) is summed as a Taylor series instead of ln()
+_LOG1P_SERIES_LIMIT = Decimal("0.01")
 
-            P = -expm1(-tp)   (since -expm1(-tp) = 1 - exp(-tp)).
+# Below this |x|, exp(x) - 1 is summed as a Taylor series instead of exp()
+_EXPM1_SERIES_LIMIT = Decimal(1)
 
-        Parameters
-        ----------
-        p : float
-            Probability of a single elementary manifestation
-            (0 < p ≤ 1). Conceptually, this is the success probability
-            of one "attempt" in the PND.
-        t : float
-            Measure of the capacity of possible distinctions (t > 0).
-            In the theory, this plays the role of a non-metric attempt
-            index rather than physical time.
 
-        Returns
-        -------
-        float
-            Manifestation probability (0 ≤ P ≤ 1).
+def _log1p_decimal(x: Decimal) -> Decimal:
+    """
+    ln(1 + x) in the current Decimal context.
 
-        Raises
-        ------
-        ValueError
-            If p <= 0 or t <= 0 (invalid parameters).
-        """
+    For small |x| the alternating series x - x²/2 + x³/3 - ... is summed
+    until adding a term no longer changes the sum (for x = -1e-20 this
+    takes only a few terms); otherwise Decimal.ln is used.
+    """
+    if not x or abs(x) >= _LOG1P_SERIES_LIMIT:
+        return (_DEC_ONE + x).ln()
+
+    total = Decimal(0)
+    power = x
+    k = 1
+    while True:
+        term = power / k
+        # Also ends the loop when the terms underflow to 0 near the
+        # bottom of the context's exponent range
+        new_total = total + term
+        if new_total == total:
+            return total
+        total = new_total
+        power *= -x
+        k += 1
+
+
+def _expm1_decimal(x: Decimal) -> Decimal:
+    """
+    exp(x) - 1 in the current Decimal context.
+
+    For small |x| the series x + x²/2! + x³/3! + ... is summed until
+    adding a term no longer changes the sum, which avoids the
+    cancellation in exp(x) - 1 (and is faster than Decimal.exp there);
+    otherwise Decimal.exp is used.
+    """
+    if not x or abs(x) >= _EXPM1_SERIES_LIMIT:
+        return x.exp() - _DEC_ONE
+
+    total = x
+    term = x
+    k = 1
+    while True:
+        k += 1
+        term = term * x / k
+        # Also ends the loop when the terms underflow to 0 near the
+        # bottom of the context's exponent range
+        new_total = total + term
+        if new_total == total:
+            return total
+        total = new_total
+
+
+def _mpfr_probability(p_str: str | Decimal, t_str: str | Decimal, digits: int):
+    """
+    -expm1(t · log1p(-p)) in MPFR arithmetic with
+    ceil(digits · log2(10)) bits. Requires gmpy2.
+    """
+    bits = math.ceil(digits * math.log2(10))
+    with gmpy2.context(precision=bits):
+        # mpfr() does not accept Decimal; str() converts it exactly
+        p = gmpy2.mpfr(str(p_str))
+        t = gmpy2.mpfr(str(t_str))
         if p <= 0 or t <= 0:
             raise ValueError("p and t must be positive")
 
-        tp = t * p
-
-        # Robust for all scales:
-        #   expm1(x) = exp(x) - 1
-        #   -expm1(-tp) = 1 - exp(-tp)
-        prob = -np.expm1(-tp)
-
-        # Clamp numerical artifacts to [0, 1]
-        return min(1.0, max(0.0, prob))
-
-    @staticmethod
-    def manifestation_probability_decimal(
-        p_str: str,
-        t_str: str,
-        precision: int = 100
-    ) -> Decimal:
-        """
-        High-precision Decimal version for critical points and discrete
-        analogues of the infinite-attempt process.
-
-        Computes the discrete expression
-
-            P(N) = 1 - (1 - p)^N
-
-        exactly (within the specified Decimal precision). For very small
-        p and large N this matches, to high accuracy, the continuous
-        model
-
-            P(tp) = 1 - exp(-tp),
-
-        with tp ≈ p · N.
-
-        Parameters
-        ----------
-        p_str : str
-            Probability of a single manifestation, as a string for high
-            precision (e.g. "1e-20").
-        t_str : str
-            Measure of potential configurations (interpreted as N),
-            as a string (e.g. "4.605170185988092e20").
-        precision : int
-            Decimal precision (number of significant digits) for the
-            calculation.
-
-        Returns
-        -------
-        Decimal
-            Manifestation probability as a Decimal object.
-
-        Raises
-        ------
-        ValueError
-            If p_str or t_str represent non-positive values.
-        """
-        getcontext().prec = precision
+        return -gmpy2.expm1(t * gmpy2.log1p(-p))
+
+
+@lru_cache(maxsize=128)
+def _critical_tp(target_p: float) -> float:
+    """
+    Memoized tp = -ln(1 - target_p) used by
+    critical_point_for_probability.
+
+    log1p keeps full precision when target_p is tiny; repeated
+    thresholds (e.g. 0.99 and 0.999 in plots and sweeps) are served
+    from the cache.
+    """
+    return -math.log1p(-target_p)
+
+
+def manifestation_probability(p: float, t: float) -> float:
+    """
+    Probability of distinction manifestation in the pre-existential
+    null domain (PND) in the continuous model.
+
+        P(t,p) = 1 - exp(-tp),
+
+    implemented in a numerically stable form via:
+
+        P = -expm1(-tp)   (since -expm1(-tp) = 1 - exp(-tp)).
+
+    Parameters
+    ----------
+    p : float
+        Probability of a single elementary manifestation
+        (0 < p ≤ 1). Conceptually, this is the success probability
+        of one "attempt" in the PND.
+    t : float
+        Measure of the capacity of possible distinctions (t > 0).
+        In the theory, this plays the role of a non-metric attempt
+        index rather than physical time.
+
+    Returns
+    -------
+    float
+        Manifestation probability (0 ≤ P ≤ 1).
+
+    Raises
+    ------
+    ValueError
+        If p <= 0 or t <= 0 (invalid parameters).
+    """
+    if p <= 0 or t <= 0:
+        raise ValueError("p and t must be positive")
+
+    tp = t * p
+
+    # Saturated regime: exp(-tp) < 2^-54, so 1 - exp(-tp) rounds to 1.0
+    if tp >= _TP_SATURATION:
+        return 1.0
+    # Linear regime: 1 - exp(-tp) = tp - tp²/2 + ... equals tp in double
+    # precision
+    if tp < _TP_LINEAR:
+        return tp
+
+    # Robust for all other scales (result lies strictly inside (0, 1)):
+    #   expm1(x) = exp(x) - 1
+    #   -expm1(-tp) = 1 - exp(-tp)
+    return -math.expm1(-tp)
+
+
+# The compiled kernel from src/_core_ext.pyx, when built, replaces the
+# pure-Python version above (same validation, regimes and docstring)
+try:
+    from ._core_ext import manifestation_probability  # noqa: F811
+except ImportError:
+    pass
+
+
+def manifestation_probability_array(p, t) -> np.ndarray:
+    """
+    Vectorized version of manifestation_probability for NumPy
+    arrays (or scalars broadcastable against them).
+
+        P(t,p) = -expm1(-tp),
+
+    evaluated in a single ufunc pass over all points instead of one
+    Python call per point (e.g. when sweeping tp for a plot).
+
+    Parameters
+    ----------
+    p : float or array_like
+        Probability of a single elementary manifestation (p > 0).
+    t : float or array_like
+        Measure of the capacity of possible distinctions (t > 0).
+
+    Returns
+    -------
+    numpy.ndarray
+        Manifestation probabilities (0 ≤ P ≤ 1), with the broadcast
+        shape of p and t.
+
+    Raises
+    ------
+    ValueError
+        If any p <= 0 or any t <= 0 (invalid parameters).
+    """
+    p = np.asarray(p, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)
+    if np.any(p <= 0) or np.any(t <= 0):
+        raise ValueError("p and t must be positive")
+
+    # Single output buffer reused by every step (also keeps 0-d inputs
+    # as arrays, so the out= arguments below are always valid)
+    out = np.empty(np.broadcast_shapes(p.shape, t.shape), dtype=np.float64)
+
+    # tp may overflow to inf for huge inputs; expm1(-inf) = -1 exactly
+    with np.errstate(over="ignore"):
+        np.multiply(p, t, out=out)
+    np.negative(out, out=out)
+    np.expm1(out, out=out)
+    np.negative(out, out=out)
+
+    # Clamp numerical artifacts to [0, 1]
+    np.clip(out, 0.0, 1.0, out=out)
+    return out
+
+
+def manifestation_probability_batch(p, t) -> np.ndarray:
+    """
+    Batch version of manifestation_probability for large sweeps over
+    many (p, t) pairs.
+
+    Uses a compiled kernel (see src/_fast.py: Numba when installed,
+    else the Cython extension if built) and falls back to
+    manifestation_probability_array otherwise. All paths return
+    identical results up to floating-point rounding.
+
+    Parameters
+    ----------
+    p : float or array_like
+        Probability of a single elementary manifestation (p > 0).
+    t : float or array_like
+        Measure of the capacity of possible distinctions (t > 0).
+
+    Returns
+    -------
+    numpy.ndarray
+        Manifestation probabilities (0 ≤ P ≤ 1), with the broadcast
+        shape of p and t.
+
+    Raises
+    ------
+    ValueError
+        If any p <= 0 or any t <= 0 (invalid parameters).
+    """
+    from ._fast import batch_probability
+
+    if batch_probability is None:
+        return manifestation_probability_array(p, t)
+
+    p, t = np.broadcast_arrays(
+        np.asarray(p, dtype=np.float64),
+        np.asarray(t, dtype=np.float64),
+    )
+    if np.any(p <= 0) or np.any(t <= 0):
+        raise ValueError("p and t must be positive")
+
+    out = np.empty(p.shape, dtype=np.float64)
+    batch_probability(
+        np.ascontiguousarray(p).ravel(),
+        np.ascontiguousarray(t).ravel(),
+        out.ravel(),
+    )
+    return out
+
+
+@lru_cache(maxsize=256)
+def manifestation_probability_decimal(
+    p_str: str | Decimal,
+    t_str: str | Decimal,
+    precision: int = DEFAULT_PRECISION
+) -> Decimal:
+    """
+    High-precision Decimal version for critical points and discrete
+    analogues of the infinite-attempt process.
+
+    Computes the discrete expression
+
+        P(N) = 1 - (1 - p)^N = 1 - exp(N · ln(1 - p))
+
+    exactly (within the specified Decimal precision). When gmpy2 is
+    installed the evaluation is done in MPFR arithmetic (see
+    manifestation_probability_mpfr) and converted to Decimal; otherwise
+    an integer N with p · N ≥ 1 is applied as a Decimal integer power
+    when 1 - p is exact at the working precision, and any other case
+    in log space via expm1, which keeps full precision when P is
+    small. For very small p and large N this matches, to high
+    accuracy, the continuous model
+
+        P(tp) = 1 - exp(-tp),
+
+    with tp ≈ p · N.
+
+    The evaluation runs in a fresh Decimal context (default rounding,
+    exponent range and traps), so the result depends only on the
+    arguments and not on the caller's context; it is memoized per
+    (p_str, t_str, precision). Call
+    manifestation_probability_decimal.cache_clear() to empty the cache.
+
+    Parameters
+    ----------
+    p_str : str or Decimal
+        Probability of a single manifestation, as a string for high
+        precision (e.g. "1e-20") or an already parsed Decimal.
+    t_str : str or Decimal
+        Measure of potential configurations (interpreted as N),
+        as a string (e.g. "4.605170185988092e20") or a Decimal.
+    precision : int
+        Decimal precision (number of significant digits) for the
+        calculation. It is applied in a fresh local Decimal context,
+        so the caller's context is neither used nor changed.
+
+    Returns
+    -------
+    Decimal
+        Manifestation probability as a Decimal object.
+
+    Raises
+    ------
+    ValueError
+        If p_str or t_str represent non-positive values.
+    """
+    # Guard digits absorb rounding in ln/exp; the result is rounded back
+    # to the requested precision below
+    digits = precision + _DECIMAL_GUARD_DIGITS
+
+    if gmpy2 is not None:
+        # MPFR (binary, C-level) is several times faster than Decimal at
+        # the same precision; convert back to Decimal at the boundary
+        prob = _mpfr_probability(p_str, t_str, digits)
+        with localcontext(Context(prec=precision)):
+            return +Decimal(format(prob, f".{digits}e"))
+
+    # A fresh context (default rounding, exponent range and traps) rather
+    # than a copy of the caller's, so the cached result is the same for
+    # every caller
+    with localcontext(Context(prec=digits)) as ctx:
 
         p = Decimal(p_str)
         t = Decimal(t_str)
         if p <= 0 or t <= 0:
             raise ValueError("p and t must be positive")
 
-        # Exact computation using Decimal:
-        return Decimal(1) - (Decimal(1) - p) ** t
-
-    @staticmethod
-    def critical_point_for_probability(target_p: float) -> float:
-        """
-        Compute the critical value of the product tp for a given
-        manifestation probability in the continuous model
-
-            P(tp) = 1 - exp(-tp).
-
-        Examples:
-            target_p = 0.99  →  tp ≈ ln(100)  ≈ 4.605170185988092
-            target_p = 0.999 →  tp ≈ ln(1000) ≈ 6.907755278982137
-
-        Parameters
-        ----------
-        target_p : float
-            Desired manifestation probability (0 < target_p < 1).
-
-        Returns
-        -------
-        float
-            The value of tp at which P = target_p.
-
-        Raises
-        ------
-        ValueError
-            If target_p is not in the interval (0, 1).
-        """
-        if not (0 < target_p < 1):
-            raise ValueError("target_p must be in (0, 1)")
-
-        return -math.log(1 - target_p)
-
-    @staticmethod
-    def nothing_weight(phi: float, scenario: str = "balanced") -> float:
-        """
-        Conceptual "weight" of the pre-existential null domain (PND),
-        defined as
-
-            E(Φ) = Φ · ρ(Φ),
-
-        where ρ(Φ) is an effective structural density. In the theory,
-        different qualitative scenarios for the evolution of the PND are
-        captured by different exponents of Φ:
-
-            'growth'    → ρ(Φ) = Φ^(-0.5)
-                          → E(Φ) = Φ * Φ^(-0.5) = Φ^(0.5)
-                          (diverges as Φ → ∞)
-
-            'balanced'  → ρ(Φ) = Φ^(-1.0)
-                          → E(Φ) = Φ * Φ^(-1.0) = 1
-                          (remains constant for any Φ)
-
-            'decay'     → ρ(Φ) = Φ^(-1.5)
-                          → E(Φ) = Φ * Φ^(-1.5) = Φ^(-0.5)
-                          (vanishes as Φ → ∞)
-
-        Parameters
-        ----------
-        phi : float
-            Current potential of nothingness (Φ > 0).
-        scenario : str
-            Evolution scenario: 'growth', 'balanced', or 'decay'.
-
-        Returns
-        -------
-        float
-            The "weight of the PND" E(Φ) for the given scenario.
-
-        Raises
-        ------
-        ValueError
-            If phi <= 0 or if an invalid scenario name is provided.
-        """
-        if phi <= 0:
-            raise ValueError("phi must be positive")
-
-        if scenario == "growth":
-            rho = phi ** -0.5
-        elif scenario == "balanced":
-            rho = phi ** -1.0
-        elif scenario == "decay":
-            rho = phi ** -1.5
+        integer_power = t * p >= _DEC_ONE and t == t.to_integral_value()
+        if integer_power:
+            # The power would magnify any rounding of 1 - p about N-fold,
+            # so it is only taken when 1 - p is exact at this precision
+            ctx.clear_flags()
+            q = _DEC_ONE - p
+            integer_power = not ctx.flags[Inexact]
+
+        if integer_power:
+            # Integer N: Decimal uses square-and-multiply (O(log N)
+            # multiplications) and needs no ln/exp at all. Restricted to
+            # tp ≥ 1, where 1 - (1 - p)^N does not cancel.
+            prob = _DEC_ONE - q ** t
         else:
-            raise ValueError("Invalid scenario: use 'growth', 'balanced', or 'decay'")
-
-        return phi * rho
-
-    @staticmethod
-    def asymmetry(phi: float) -> float:
-        """
-        Symmetry-breaking function defining the emergence of distinction
-        between non-being and being as the potential Φ of the PND grows.
-
-        Analytic forms (equivalent):
-
-            A(Φ) = tanh(ln Φ)
-                 = (Φ² - 1) / (Φ² + 1)
-
-        Properties:
-            - A(1)   = 0
-              (perfect symmetry: neither being nor non-being is preferred)
-            - A(Φ) →  1    as Φ → ∞
-              (maximal bias towards being)
-            - A(Φ) → -1    as Φ → 0⁺
-              (formal extension towards non-being)
-
-        Parameters
-        ----------
-        phi : float
-            Potential of nothingness (Φ > 0).
-
-        Returns
-        -------
-        float
-            Asymmetry measure in the range (-1, 1).
-
-        Raises
-        ------
-        ValueError
-            If phi <= 0 (undefined for non-positive Φ).
-        """
-        if phi <= 0:
-            raise ValueError("phi must be positive")
-
-        # tanh(log Φ) ≡ (Φ² - 1) / (Φ² + 1)
-        return math.tanh(math.log(phi))
-
-    @staticmethod
-    def structure_density(t: float, k: float = 0.01, rho0: float = 1.0) -> float:
-        """
-        Structure density evolution over an abstract evolution parameter t.
-
-        Simple densification model:
-
-            ρ(t) = ρ₀ · exp(k t),
-
-        where ρ(t) can be interpreted as structural density of a world,
-        a proto-world, or a nested reality level. This is a toy model
-        used in the text to illustrate how "condensation" of reality can
-        be described mathematically.
-
-        Parameters
-        ----------
-        t : float
-            Evolution parameter (can be meta-time or any analogous
-            measure; not necessarily physical time).
-        k : float
-            Growth rate (k > 0).
-        rho0 : float
-            Initial density at t = 0.
-
-        Returns
-        -------
-        float
-            Density ρ(t) at the given t.
-
-        Raises
-        ------
-        ValueError
-            If k <= 0 (growth rate must be positive for exponential
-            growth).
-        """
-        if k <= 0:
-            raise ValueError("k must be positive")
-
-        return rho0 * math.exp(k * t)
+            # 1 - (1 - p)^t = -expm1(t · ln(1 - p)), evaluated in log
+            # space; expm1 keeps full precision when P is small
+            prob = -_expm1_decimal(t * _log1p_decimal(-p))
+
+        ctx.prec = precision
+        return +prob
+
+
+def manifestation_probability_mpfr(
+    p_str: str | Decimal,
+    t_str: str | Decimal,
+    precision: int = DEFAULT_PRECISION
+):
+    """
+    Binary multiple-precision version of
+    manifestation_probability_decimal based on gmpy2 (MPFR).
+
+    Computes the same discrete expression
+
+        P(N) = 1 - (1 - p)^N = -expm1(N · log1p(-p))
+
+    with MPFR arithmetic, which is considerably faster than Decimal
+    at equivalent precision. The decimal precision is mapped to
+    ceil(precision · log2(10)) bits. gmpy2 is an optional
+    dependency: when it is not installed this falls back to
+    manifestation_probability_decimal.
+
+    Parameters
+    ----------
+    p_str : str or Decimal
+        Probability of a single manifestation, as a string for high
+        precision (e.g. "1e-20") or an already parsed Decimal.
+    t_str : str or Decimal
+        Measure of potential configurations (interpreted as N),
+        as a string (e.g. "4.605170185988092e20") or a Decimal.
+    precision : int
+        Number of significant decimal digits for the calculation.
+
+    Returns
+    -------
+    gmpy2.mpfr or Decimal
+        Manifestation probability as an mpfr object (a Decimal
+        object when gmpy2 is unavailable).
+
+    Raises
+    ------
+    ValueError
+        If p_str or t_str represent non-positive values.
+    """
+    if gmpy2 is None:
+        return manifestation_probability_decimal(
+            p_str, t_str, precision
+        )
+
+    return _mpfr_probability(p_str, t_str, precision)
+
+
+def critical_point_for_probability(target_p: float) -> float:
+    """
+    Compute the critical value of the product tp for a given
+    manifestation probability in the continuous model
+
+        P(tp) = 1 - exp(-tp).
+
+    Examples:
+        target_p = 0.99  →  tp ≈ ln(100)  ≈ 4.605170185988092
+        target_p = 0.999 →  tp ≈ ln(1000) ≈ 6.907755278982137
+
+    Parameters
+    ----------
+    target_p : float
+        Desired manifestation probability (0 < target_p < 1).
+
+    Returns
+    -------
+    float
+        The value of tp at which P = target_p.
+
+    Raises
+    ------
+    ValueError
+        If target_p is not in the interval (0, 1).
+    """
+    if not (0 < target_p < 1):
+        raise ValueError("target_p must be in (0, 1)")
+
+    return _critical_tp(target_p)
+
+
+def nothing_weight(phi: float, scenario: str = "balanced") -> float:
+    """
+    Conceptual "weight" of the pre-existential null domain (PND),
+    defined as
+
+        E(Φ) = Φ · ρ(Φ),
+
+    where ρ(Φ) is an effective structural density. In the theory,
+    different qualitative scenarios for the evolution of the PND are
+    captured by different exponents of Φ:
+
+        'growth'    → ρ(Φ) = Φ^(-0.5)
+                      → E(Φ) = Φ * Φ^(-0.5) = Φ^(0.5)
+                      (diverges as Φ → ∞)
+
+        'balanced'  → ρ(Φ) = Φ^(-1.0)
+                      → E(Φ) = Φ * Φ^(-1.0) = 1
+                      (remains constant for any Φ)
+
+        'decay'     → ρ(Φ) = Φ^(-1.5)
+                      → E(Φ) = Φ * Φ^(-1.5) = Φ^(-0.5)
+                      (vanishes as Φ → ∞)
+
+    Parameters
+    ----------
+    phi : float
+        Current potential of nothingness (Φ > 0).
+    scenario : str
+        Evolution scenario: 'growth', 'balanced', or 'decay'.
+
+    Returns
+    -------
+    float
+        The "weight of the PND" E(Φ) for the given scenario.
+
+    Raises
+    ------
+    ValueError
+        If phi <= 0 or if an invalid scenario name is provided.
+    """
+    if phi <= 0:
+        raise ValueError("phi must be positive")
+
+    # Default scenario first: E(Φ) = Φ^(0) = 1 needs no computation
+    if scenario == "balanced":
+        return 1.0
+
+    try:
+        weight = _WEIGHT[scenario]
+    except KeyError:
+        raise ValueError(
+            "Invalid scenario: use 'growth', 'balanced', or 'decay'"
+        ) from None
+
+    return weight(phi)
+
+
+def asymmetry(phi: float) -> float:
+    """
+    Symmetry-breaking function defining the emergence of distinction
+    between non-being and being as the potential Φ of the PND grows.
+
+    Analytic forms (equivalent):
+
+        A(Φ) = tanh(ln Φ)
+             = (Φ² - 1) / (Φ² + 1)
+
+    The rational form is used, as it needs no transcendental calls.
+
+    Properties:
+        - A(1)   = 0
+          (perfect symmetry: neither being nor non-being is preferred)
+        - A(Φ) →  1    as Φ → ∞
+          (maximal bias towards being)
+        - A(Φ) → -1    as Φ → 0⁺
+          (formal extension towards non-being)
+
+    Parameters
+    ----------
+    phi : float
+        Potential of nothingness (Φ > 0).
+
+    Returns
+    -------
+    float
+        Asymmetry measure in the range (-1, 1).
+
+    Raises
+    ------
+    ValueError
+        If phi <= 0 (undefined for non-positive Φ).
+    """
+    if phi <= 0:
+        raise ValueError("phi must be positive")
+
+    # Beyond this Φ, A(Φ) = 1 - 2/(Φ² + 1) rounds to 1.0 while Φ²
+    # itself would overflow to inf (and inf/inf → nan)
+    if phi > _PHI_SATURATION:
+        return 1.0
+
+    # (Φ² - 1) / (Φ² + 1) ≡ tanh(log Φ), without transcendentals
+    phi2 = phi * phi
+    return (phi2 - 1.0) / (phi2 + 1.0)
+
+
+def asymmetry_array(phi) -> np.ndarray:
+    """
+    Vectorized version of asymmetry for NumPy arrays.
+
+        A(Φ) = (Φ² - 1) / (Φ² + 1),
+
+    evaluated element-wise as a single arithmetic expression (no
+    log/tanh ufuncs), in one fused parallel pass when Numba is
+    installed (see src/_fast.py).
+
+    Parameters
+    ----------
+    phi : float or array_like
+        Potential of nothingness (Φ > 0).
+
+    Returns
+    -------
+    numpy.ndarray
+        Asymmetry measures in the range (-1, 1), with the shape of
+        phi.
+
+    Raises
+    ------
+    ValueError
+        If any phi <= 0 (undefined for non-positive Φ).
+    """
+    from ._fast import batch_asymmetry
+
+    phi = np.asarray(phi, dtype=np.float64)
+    if np.any(phi <= 0):
+        raise ValueError("phi must be positive")
+
+    if batch_asymmetry is not None:
+        out = np.empty(phi.shape, dtype=np.float64)
+        batch_asymmetry(np.ascontiguousarray(phi).ravel(), out.ravel())
+        return out
+
+    # Same saturation as the scalar version: keeps Φ² finite
+    phi2 = np.square(np.minimum(phi, _PHI_SATURATION))
+    return (phi2 - 1.0) / (phi2 + 1.0)
+
+
+def structure_density(t: float, k: float = 0.01, rho0: float = 1.0) -> float:
+    """
+    Structure density evolution over an abstract evolution parameter t.
+
+    Simple densification model:
+
+        ρ(t) = ρ₀ · exp(k t),
+
+    where ρ(t) can be interpreted as structural density of a world,
+    a proto-world, or a nested reality level. This is a toy model
+    used in the text to illustrate how "condensation" of reality can
+    be described mathematically.
+
+    Parameters
+    ----------
+    t : float
+        Evolution parameter (can be meta-time or any analogous
+        measure; not necessarily physical time).
+    k : float
+        Growth rate (k > 0).
+    rho0 : float
+        Initial density at t = 0.
+
+    Returns
+    -------
+    float
+        Density ρ(t) at the given t.
+
+    Raises
+    ------
+    ValueError
+        If k <= 0 (growth rate must be positive for exponential
+        growth).
+    """
+    if k <= 0:
+        raise ValueError("k must be positive")
+
+    return rho0 * math.exp(k * t)
+
+
+def structure_density_array(
+    t,
+    k: float = 0.01,
+    rho0: float = 1.0
+) -> np.ndarray:
+    """
+    Vectorized version of structure_density for NumPy arrays of t.
+
+        ρ(t) = ρ₀ · exp(k t),
+
+    evaluated with a single np.exp call over the whole grid (e.g.
+    when plotting a densification curve).
+
+    Parameters
+    ----------
+    t : float or array_like
+        Evolution parameter values.
+    k : float
+        Growth rate (k > 0).
+    rho0 : float
+        Initial density at t = 0.
+
+    Returns
+    -------
+    numpy.ndarray
+        Densities ρ(t), with the shape of t.
+
+    Raises
+    ------
+    ValueError
+        If k <= 0 (growth rate must be positive for exponential
+        growth).
+    """
+    if k <= 0:
+        raise ValueError("k must be positive")
+
+    return rho0 * np.exp(k * np.asarray(t, dtype=np.float64))
+
+
+class FZVerifier:
+    """
+    FZ Theory verification toolkit with numerically stable implementations.
+
+    This class bundles, as static methods, the module-level functions
+    implementing the core mathematical components used in the article
+    on FZ Theory: the manifestation probability in a pre-existential
+    null domain (PND), critical tp thresholds, high-precision discrete
+    analogues of the infinite-attempt process, a phenomenological
+    "weight" model for the PND, the asymmetry function A(Φ) describing
+    symmetry breaking between non-being and being, and a simple
+    densification model ρ(t). Hot-path callers can import the functions
+    directly from src.core.
+
+    FIXED:
+    - Removed legacy unstable branches.
+    - All formulas now use a single, mathematically consistent and
+      numerically robust implementation that matches the published
+      definitions.
+    """
+
+    manifestation_probability = staticmethod(manifestation_probability)
+    manifestation_probability_array = staticmethod(
+        manifestation_probability_array
+    )
+    manifestation_probability_batch = staticmethod(
+        manifestation_probability_batch
+    )
+    manifestation_probability_decimal = staticmethod(
+        manifestation_probability_decimal
+    )
+    manifestation_probability_mpfr = staticmethod(
+        manifestation_probability_mpfr
+    )
+    critical_point_for_probability = staticmethod(
+        critical_point_for_probability
+    )
+    nothing_weight = staticmethod(nothing_weight)
+    asymmetry = staticmethod(asymmetry)
+    asymmetry_array = staticmethod(asymmetry_array)
+    structure_density = staticmethod(structure_density)
+    structure_density_array = staticmethod(structure_density_array)
+
+
+@cache
+def get_verifier() -> FZVerifier:
+    """
+    Shared FZVerifier instance.
+
+    FZVerifier is stateless, so a single instance can serve every
+    caller (e.g. all test cases); it is created on the first call.
+
+    Returns
+    -------
+    FZVerifier
+        The process-wide verifier instance.
+    """
+    return FZVerifier()
@@ -1,9 +1,14 @@
 import unittest
 import numpy as np
 import math
-from decimal import Decimal, getcontext
+from decimal import ROUND_DOWN, ROUND_UP, Decimal, localcontext
 
-from src.core import FZVerifier
+from src.core import FZVerifier, get_verifier, manifestation_probability
+
+# Expected P at the 99% critical point and the tolerance of the
+# high-precision checks, parsed once at import
+_EXPECTED_99 = Decimal("0.99")
+_DEC_TOL = Decimal("1e-15")
 
 
 class TestFZTheory(unittest.TestCase):
@@ -25,17 +30,65 @@ class TestFZTheory(unittest.TestCase):
     функции и функция асимметрии A(Φ), используемая в статье.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         English:
-        Initialize the verifier and high-precision Decimal context.
+        Fetch the shared verifier (get_verifier) for all tests of the
+        class; Decimal precision is set locally by the tests that need
+        it. Also builds a table of (p, t) pairs covering the regimes
+        checked one by one in the scalar tests (critical points
+        P = 0.99 and P = 0.999, saturation P → 1) together with the
+        expected probabilities, so that the batch API can be verified
+        in a single call, and warms up the optional Numba kernels.
 
         Русский:
-        Инициализация проверяющего класса и установка высокой точности
-        для Decimal-вычислений.
+        Однократное для всех тестов класса получение общего экземпляра
+        проверяющего класса (get_verifier); точность Decimal задаётся
+        локально в тех тестах, где она нужна. Также строит таблицу пар
+        (p, t), охватывающую режимы, которые скалярные тесты проверяют
+        по отдельности (критические точки P = 0.99 и P = 0.999,
+        насыщение P → 1), вместе с ожидаемыми вероятностями, чтобы
+        пакетный API проверялся одним вызовом, и выполняет прогрев
+        (JIT-компиляцию) необязательных ядер Numba.
         """
-        self.verifier = FZVerifier()
-        getcontext().prec = 50
+        cls.verifier = get_verifier()
+
+        cls._pt_pairs = np.array([
+            (1e-20, 4.605170185988092e20),
+            (1e-20, 6.907755278982137e20),
+            (1e-20, 1e22),
+            (1e-100, 1e102),
+        ], dtype=np.float64)
+        cls._pt_expected = np.array([0.99, 0.999, 1.0, 1.0])
+
+        # Decimal inputs of test_decimal_precision, parsed once
+        cls._P = Decimal("1e-20")
+        cls._T = Decimal("4.605170185988092e20")
+
+        # tp at which P = 0.99, shared by the tests that need it
+        cls._critical_tp_99 = cls.verifier.critical_point_for_probability(0.99)
+
+        # Compile the optional Numba kernels once here, so JIT time is
+        # not charged to whichever test happens to call them first
+        cls.verifier.manifestation_probability_batch(1.0, 1.0)
+        cls.verifier.asymmetry_array(1.0)
+
+    def _close(self, first, second, places=7):
+        """
+        English:
+        Same check as assertAlmostEqual(first, second, places=places),
+        i.e. |first - second| ≤ 0.5 · 10^-places, done with a single
+        math.isclose call instead of round().
+
+        Русский:
+        Та же проверка, что и assertAlmostEqual(first, second,
+        places=places), т.е. |first - second| ≤ 0.5 · 10^-places,
+        выполняемая одним вызовом math.isclose вместо round().
+        """
+        if not math.isclose(first, second, rel_tol=0.0,
+                            abs_tol=0.5 * 10.0 ** -places):
+            self.fail(f"{first!r} != {second!r} within {places} places")
 
     def test_critical_point_99_percent(self):
         """
@@ -57,16 +110,41 @@ class TestFZTheory(unittest.TestCase):
         через manifestation_probability(p, t), где tp = p * t.
         """
         target_p = 0.99
-        critical_tp = self.verifier.critical_point_for_probability(target_p)
+        critical_tp = self._critical_tp_99
 
         p = 1e-20
         t = critical_tp / p
         calculated_p = self.verifier.manifestation_probability(p, t)
 
-        self.assertAlmostEqual(
+        self._close(
             calculated_p, target_p, places=15
         )
 
+    def test_critical_point_small_probability(self):
+        """
+        English:
+        For a tiny target probability the critical point must satisfy
+        tp ≈ target_p (first-order expansion of -ln(1 - P)); a naive
+        -log(1 - P) loses all digits here. Probabilities outside (0, 1)
+        are rejected.
+
+        Русский:
+        Для очень малой целевой вероятности критическая точка должна
+        удовлетворять tp ≈ target_p (первый порядок разложения
+        -ln(1 - P)); наивное -log(1 - P) здесь теряет все значащие
+        цифры. Вероятности вне интервала (0, 1) отвергаются.
+        """
+        self.assertEqual(
+            self.verifier.critical_point_for_probability(1e-20), 1e-20
+        )
+        self._close(
+            self.verifier.critical_point_for_probability(0.999),
+            math.log(1000), places=14
+        )
+
+        with self.assertRaises(ValueError):
+            self.verifier.critical_point_for_probability(1.0)
+
     def test_extreme_limit(self):
         """
         English:
@@ -107,16 +185,211 @@ class TestFZTheory(unittest.TestCase):
         Это с высокой точностью соответствует непрерывному выражению
         P(tp) = 1 - exp(-tp) при tp ≈ ln(100).
         """
-        p_str = "1e-20"
-        t_str = "4.605170185988092e20"
+        with localcontext() as ctx:
+            ctx.prec = 50
+            calculated_p = self.verifier.manifestation_probability_decimal(
+                self._P, self._T, precision=50
+            )
+
+            error = abs(calculated_p - _EXPECTED_99)
+            self.assertLess(error, _DEC_TOL)
+
+            # String and Decimal inputs are interchangeable
+            self.assertEqual(
+                calculated_p,
+                self.verifier.manifestation_probability_decimal(
+                    "1e-20", "4.605170185988092e20", precision=50
+                ),
+            )
+
+            # The calculation must not leak its precision into the
+            # caller's Decimal context
+            self.assertEqual(ctx.prec, 50)
+
+    def test_decimal_cache(self):
+        """
+        English:
+        Repeated high-precision requests for the same critical point
+        are served from the memoization cache; cache_clear() empties it.
+        The cached value must not depend on the rounding mode of the
+        caller's Decimal context.
+
+        Русский:
+        Повторные высокоточные запросы одной и той же критической точки
+        обслуживаются из кэша мемоизации; cache_clear() очищает его.
+        Кэшированное значение не должно зависеть от режима округления
+        в Decimal-контексте вызывающего кода.
+        """
+        decimal_p = self.verifier.manifestation_probability_decimal
+        decimal_p.cache_clear()
+
+        first = decimal_p("1e-20", "4.605170185988092e20", 50)
+        second = decimal_p("1e-20", "4.605170185988092e20", 50)
+        self.assertIs(first, second)
+        self.assertEqual(decimal_p.cache_info().hits, 1)
+
+        decimal_p.cache_clear()
+        self.assertEqual(decimal_p.cache_info().currsize, 0)
+
+        results = []
+        for rounding in (ROUND_DOWN, ROUND_UP):
+            decimal_p.cache_clear()
+            with localcontext() as ctx:
+                ctx.rounding = rounding
+                results.append(decimal_p("1e-20", "4.605170185988092e20", 20))
+        self.assertEqual(results[0], results[1])
+        decimal_p.cache_clear()
+
+    def test_decimal_log_space(self):
+        """
+        English:
+        manifestation_probability_decimal uses an exact integer power
+        for integer N and the log-space form exp(N · ln(1 - p)) for
+        non-integer N. Both branches must agree: N = 7 against N = 7.0
+        + 1e-40, and non-integer N for a moderate p (no series
+        shortcut) against (1 - p)^N computed directly.
+
+        Русский:
+        manifestation_probability_decimal использует точную целую
+        степень для целого N и логарифмическую форму
+        exp(N · ln(1 - p)) для нецелого N. Обе ветви должны
+        согласовываться: N = 7 против N = 7 + 1e-40, а также нецелое N
+        при умеренном p (без разложения в ряд) против (1 - p)^N,
+        вычисленного напрямую.
+        """
+        integer_p = self.verifier.manifestation_probability_decimal(
+            "0.3", "7", precision=50
+        )
+        self.assertEqual(integer_p, Decimal(1) - Decimal("0.7") ** 7)
+
+        near_integer_p = self.verifier.manifestation_probability_decimal(
+            "0.3", "7.0000000000000000000000000000000000000001", precision=50
+        )
+        self.assertLess(abs(near_integer_p - integer_p), Decimal("1e-39"))
 
         calculated_p = self.verifier.manifestation_probability_decimal(
-            p_str, t_str, precision=50
+            "0.3", "7.5", precision=50
+        )
+        with localcontext() as ctx:
+            ctx.prec = 50
+            expected_p = Decimal(1) - Decimal("0.7") ** Decimal("7.5")
+
+            error = abs(calculated_p - expected_p)
+            self.assertLess(error, Decimal("1e-45"))
+
+    def test_decimal_small_probability(self):
+        """
+        English:
+        For a small manifestation probability (tp = 3e-30) all requested
+        digits must be correct: 1 - (1 - p)^N evaluated naively cancels
+        about 30 of the 50 digits, the expm1 form does not. Checked for
+        integer and non-integer N against a 300-digit reference.
+
+        Русский:
+        При малой вероятности проявления (tp = 3e-30) все запрошенные
+        цифры должны быть верными: наивное вычисление 1 - (1 - p)^N
+        теряет около 30 из 50 цифр из-за вычитания близких чисел,
+        форма через expm1 — нет. Проверяется для целого и нецелого N
+        относительно эталона с точностью 300 цифр.
+        """
+        p = Decimal("1e-30")
+        for t in (Decimal("3"), Decimal("3.5")):
+            with self.subTest(t=t):
+                calculated_p = self.verifier.manifestation_probability_decimal(
+                    p, t, precision=50
+                )
+                with localcontext() as ctx:
+                    ctx.prec = 300
+                    reference = Decimal(1) - (Decimal(1) - p) ** t
+                    error = abs(calculated_p - reference) / reference
+                self.assertLess(error, Decimal("1e-48"))
+
+    def test_decimal_inexact_base(self):
+        """
+        English:
+        The exact integer power is only valid when 1 - p is exact at
+        the working precision; otherwise its rounding error is raised
+        to the power N. Integer N with p below 10^-(precision + 10) or
+        with more significant digits than that must still give all
+        requested digits, checked against a 300-digit reference.
+
+        Русский:
+        Точная целая степень допустима, только если 1 - p точно
+        представимо при рабочей точности; иначе ошибка его округления
+        возводится в степень N. Для целого N при p меньше
+        10^-(precision + 10) или с большим числом значащих цифр
+        результат всё равно должен содержать все запрошенные цифры;
+        сравнение с эталоном с точностью 300 цифр.
+        """
+        cases = [
+            (Decimal("1e-20"), Decimal("4.605170185988092e20"), 5),
+            (Decimal("1e-100"), Decimal("1e100"), 50),
+            (
+                Decimal(
+                    "1.2345678901234567890123456789012345678901234567891e-20"
+                ),
+                Decimal("400000000000000000000"),
+                50,
+            ),
+        ]
+        for p, t, precision in cases:
+            with self.subTest(p=p, t=t, precision=precision):
+                calculated_p = self.verifier.manifestation_probability_decimal(
+                    p, t, precision=precision
+                )
+                with localcontext() as ctx:
+                    ctx.prec = 300
+                    reference = Decimal(1) - (Decimal(1) - p) ** t
+                    error = abs(calculated_p - reference) / reference
+                self.assertLess(error, Decimal(10) ** (2 - precision))
+
+    def test_decimal_tiny_probability(self):
+        """
+        English:
+        For p near the bottom of the Decimal exponent range the series
+        terms underflow to zero; the evaluation must still terminate
+        and return P ≈ tp.
+
+        Русский:
+        При p вблизи нижней границы диапазона порядков Decimal члены
+        ряда обращаются в ноль из-за потери значимости; вычисление
+        всё равно должно завершаться и возвращать P ≈ tp.
+        """
+        cases = [
+            ("1e-999999", "1000.5", Decimal("1.0005e-999996")),
+            ("1e-999999", "0.5", Decimal("5e-1000000")),
+            ("1e-999999", "3", Decimal("3e-999999")),
+            ("1e-999990", "1e-9", Decimal("1e-999999")),
+        ]
+        for p, t, expected_p in cases:
+            with self.subTest(p=p, t=t):
+                self.assertEqual(
+                    self.verifier.manifestation_probability_decimal(
+                        p, t, precision=50
+                    ),
+                    expected_p,
+                )
+
+    def test_mpfr_precision(self):
+        """
+        English:
+        The MPFR (gmpy2) version, or its Decimal fallback when gmpy2 is
+        not installed, must reproduce the P ≈ 0.99 critical point of
+        test_decimal_precision and reject non-positive inputs.
+
+        Русский:
+        Версия на MPFR (gmpy2), либо её Decimal-замена при отсутствии
+        gmpy2, должна воспроизводить критическую точку P ≈ 0.99 из
+        test_decimal_precision и отвергать неположительные входы.
+        """
+        calculated_p = self.verifier.manifestation_probability_mpfr(
+            "1e-20", "4.605170185988092e20", precision=50
         )
-        expected_p = Decimal("0.99")
+        error = abs(Decimal(str(calculated_p)) - _EXPECTED_99)
+        self.assertLess(error, _DEC_TOL)
 
-        error = abs(calculated_p - expected_p)
-        self.assertLess(error, Decimal("1e-15"))
+        with self.assertRaises(ValueError):
+            self.verifier.manifestation_probability_mpfr("0", "1e20")
 
     def test_nothing_weight_scenarios(self):
         """
@@ -135,14 +408,19 @@ class TestFZTheory(unittest.TestCase):
         """
         phi = 1e20
 
-        growth_weight = self.verifier.nothing_weight(phi, "growth")
-        self.assertAlmostEqual(growth_weight, 1e10, places=5)
+        # (scenario, expected E(Φ), decimal places)
+        scenarios = [
+            ("growth", 1e10, 5),
+            ("balanced", 1.0, 10),
+            ("decay", 1e-10, 15),
+        ]
+        for scenario, expected, places in scenarios:
+            with self.subTest(scenario=scenario):
+                weight = self.verifier.nothing_weight(phi, scenario)
+                self._close(weight, expected, places=places)
 
-        balanced_weight = self.verifier.nothing_weight(phi, "balanced")
-        self.assertAlmostEqual(balanced_weight, 1.0, places=10)
-
-        decay_weight = self.verifier.nothing_weight(phi, "decay")
-        self.assertAlmostEqual(decay_weight, 1e-10, places=15)
+        with self.assertRaises(ValueError):
+            self.verifier.nothing_weight(phi, "unknown")
 
     def test_asymmetry_function(self):
         """
@@ -152,51 +430,198 @@ class TestFZTheory(unittest.TestCase):
 
             A(Φ) = (Φ² - 1) / (Φ² + 1),
 
-        and is here implemented in the equivalent analytic form
-        A(Φ) = tanh(ln Φ). We check symmetry at Φ = 1, an intermediate
-        regime around Φ ≈ 4.38 (A ≈ 0.9009) and near-complete bias for
-        Φ → ∞.
+        and is implemented directly in this rational form (equivalent to
+        A(Φ) = tanh(ln Φ)). We check symmetry at Φ = 1, an intermediate
+        regime around Φ ≈ 4.38 (A ≈ 0.9009), near-complete bias for
+        Φ → ∞, and agreement of asymmetry_array with tanh(ln Φ).
 
         Русский:
         Тест функции асимметрии A(Φ), которая в статье задаётся как
 
             A(Φ) = (Φ² - 1) / (Φ² + 1),
 
-        а здесь реализована в эквивалентной аналитической форме
-        A(Φ) = tanh(ln Φ). Проверяем симметрию при Φ = 1, промежуточный
-        режим около Φ ≈ 4.38 (A ≈ 0.9009) и практически полную
-        асимметрию при Φ → ∞.
+        и реализована непосредственно в этой рациональной форме
+        (эквивалентной A(Φ) = tanh(ln Φ)). Проверяем симметрию при
+        Φ = 1, промежуточный режим около Φ ≈ 4.38 (A ≈ 0.9009),
+        практически полную асимметрию при Φ → ∞ и совпадение
+        asymmetry_array с tanh(ln Φ).
         """
-        self.assertAlmostEqual(self.verifier.asymmetry(1.0), 0.0, places=15)
+        self._close(self.verifier.asymmetry(1.0), 0.0, places=15)
 
         calc_val = self.verifier.asymmetry(4.38)
-        self.assertAlmostEqual(calc_val, 0.9009, places=3)
+        self._close(calc_val, 0.9009, places=3)
+
+        self._close(self.verifier.asymmetry(1e10), 1.0, places=15)
+
+        phis = np.array([1e-3, 0.5, 1.0, 4.38, 1e10, 1e200])
+        np.testing.assert_allclose(
+            self.verifier.asymmetry_array(phis),
+            [math.tanh(math.log(phi)) for phi in phis],
+            rtol=0, atol=1e-15,
+        )
+        self.assertEqual(self.verifier.asymmetry(1e200), 1.0)
+        self.assertTrue(np.isnan(self.verifier.asymmetry_array([np.nan])[0]))
 
-        self.assertAlmostEqual(self.verifier.asymmetry(1e10), 1.0, places=15)
+    def test_structure_density(self):
+        """
+        English:
+        Densification model ρ(t) = ρ₀ · exp(k t): the scalar and the
+        vectorized structure_density_array must agree on a grid of t,
+        give ρ₀ at t = 0 and reject non-positive growth rates.
+
+        Русский:
+        Модель уплотнения ρ(t) = ρ₀ · exp(k t): скалярная и
+        векторизованная structure_density_array должны совпадать на
+        сетке значений t, давать ρ₀ при t = 0 и отвергать
+        неположительные скорости роста.
+        """
+        ts = np.linspace(0.0, 500.0, 51)
+        densities = self.verifier.structure_density_array(ts, k=0.02, rho0=2.0)
+        expected = [
+            self.verifier.structure_density(t, k=0.02, rho0=2.0) for t in ts
+        ]
+        np.testing.assert_allclose(densities, expected, rtol=1e-15)
+        self.assertEqual(densities[0], 2.0)
+
+        with self.assertRaises(ValueError):
+            self.verifier.structure_density_array(ts, k=0.0)
+
+    def test_module_level_functions(self):
+        """
+        English:
+        The core formulas are plain module-level functions; FZVerifier
+        only re-exposes them as static methods, so both call styles
+        give identical results.
+
+        Русский:
+        Основные формулы реализованы как функции уровня модуля;
+        FZVerifier лишь предоставляет их как статические методы,
+        поэтому оба способа вызова дают одинаковый результат.
+        """
+        self.assertIs(
+            FZVerifier.manifestation_probability, manifestation_probability
+        )
+        self.assertIsInstance(self.verifier, FZVerifier)
+        self.assertIs(get_verifier(), self.verifier)
+        self.assertEqual(
+            manifestation_probability(1e-20, 4.605170185988092e20),
+            self.verifier.manifestation_probability(
+                1e-20, 4.605170185988092e20
+            ),
+        )
 
     def test_numerical_stability(self):
         """
         English:
         Stress-tests numerical stability for extreme parameter values in
-        the manifestation probability, including very large tp and
-        validation of error handling for invalid inputs (p <= 0 or
-        t <= 0).
+        the manifestation probability, including very large and very
+        small tp (no cancellation in 1 - exp(-tp)) and validation of
+        error handling for invalid inputs (p <= 0 or t <= 0).
 
         Русский:
         Стресс-тесты численной устойчивости для экстремальных значений
-        в вероятности проявления, включая очень большие tp и проверку
-        корректной обработки некорректных входов (p <= 0 или t <= 0).
+        в вероятности проявления, включая очень большие и очень малые
+        tp (без потери точности в 1 - exp(-tp)) и проверку корректной
+        обработки некорректных входов (p <= 0 или t <= 0).
         """
         p = 1e-100
         t = 1e102
         prob = self.verifier.manifestation_probability(p, t)
         self.assertEqual(prob, 1.0)
 
+        # Small tp: P = tp - tp²/2 + ... must keep full relative
+        # precision (1 - exp(-tp) would cancel to ~7 correct digits)
+        tp = 1e-10
+        expected = tp * (1.0 - tp / 2.0)
+        self.assertTrue(math.isclose(
+            self.verifier.manifestation_probability(1.0, tp), expected,
+            rel_tol=1e-15,
+        ))
+        self.assertTrue(math.isclose(
+            float(self.verifier.manifestation_probability_array(1.0, tp)),
+            expected, rel_tol=1e-15,
+        ))
+
+        # Both sides of the saturation and linear shortcuts agree with
+        # the direct expm1 evaluation
+        for tp in (37.0, 38.0, 1e-16, 1e-17):
+            self.assertEqual(
+                self.verifier.manifestation_probability(1.0, tp),
+                -math.expm1(-tp),
+            )
+
         with self.assertRaises(ValueError):
             self.verifier.manifestation_probability(-1e-20, 1e20)
         with self.assertRaises(ValueError):
             self.verifier.manifestation_probability(1e-20, -1e20)
 
+    def test_manifestation_probability_array(self):
+        """
+        English:
+        The vectorized manifestation_probability_array must agree with
+        the scalar manifestation_probability point by point, saturate
+        to 1.0 for very large tp and reject non-positive inputs.
+
+        Русский:
+        Векторизованная manifestation_probability_array должна
+        поточечно совпадать со скалярной manifestation_probability,
+        насыщаться до 1.0 при очень больших tp и отвергать
+        неположительные входные значения.
+        """
+        xs = np.linspace(0.1, 10.0, 100)
+        ys = self.verifier.manifestation_probability_array(1.0, xs)
+        expected = [
+            self.verifier.manifestation_probability(1.0, x) for x in xs
+        ]
+        np.testing.assert_allclose(ys, expected, rtol=0, atol=1e-15)
+
+        saturated = self.verifier.manifestation_probability_array(
+            [1e-20, 1e-20, 10.0], [1e22, 1e102, 1e308]
+        )
+        np.testing.assert_array_equal(saturated, [1.0, 1.0, 1.0])
+
+        scalar = self.verifier.manifestation_probability_array(0.5, 2.0)
+        self.assertEqual(scalar.shape, ())
+        self.assertEqual(
+            float(scalar), self.verifier.manifestation_probability(0.5, 2.0)
+        )
+
+        with self.assertRaises(ValueError):
+            self.verifier.manifestation_probability_array(1.0, [1.0, -1.0])
+
+    def test_manifestation_probability_batch(self):
+        """
+        English:
+        The batch entry point (compiled kernel when available, NumPy
+        otherwise) evaluates all (p, t) pairs of the scalar regimes in
+        one call and must reproduce the expected probabilities as well
+        as manifestation_probability_array, including broadcasting of a
+        scalar p against an array t.
+
+        Русский:
+        Пакетная функция (компилированное ядро при наличии, иначе
+        NumPy) вычисляет все пары (p, t) скалярных режимов одним
+        вызовом и должна воспроизводить ожидаемые вероятности, а также
+        manifestation_probability_array, включая broadcasting
+        скалярного p по массиву t.
+        """
+        p, t = self._pt_pairs[:, 0], self._pt_pairs[:, 1]
+        batch = self.verifier.manifestation_probability_batch(p, t)
+        np.testing.assert_allclose(
+            batch, self._pt_expected, rtol=0, atol=1e-15
+        )
+
+        broadcast = self.verifier.manifestation_probability_batch(1e-20, t)
+        expected = self.verifier.manifestation_probability_array(1e-20, t)
+        np.testing.assert_allclose(broadcast, expected, rtol=0, atol=1e-15)
+
+        # NaN propagates as in manifestation_probability_array
+        nan_p = self.verifier.manifestation_probability_batch([np.nan], [1.0])
+        self.assertTrue(np.isnan(nan_p[0]))
+
+        with self.assertRaises(ValueError):
+            self.verifier.manifestation_probability_batch(0.0, t)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)